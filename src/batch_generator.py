@@ -3,10 +3,58 @@ Batch Blog Post Image Generator
 Process multiple blog posts from JSON file
 """
 
+import os
+import sys
 import json
+import logging
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from image_generator import BlogImageGenerator
+
+try:
+    import ijson
+except ImportError:  # Streaming is optional; fall back to json.load
+    ijson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _stream_posts(events):
+    """Yield posts from ijson events, reporting malformed JSON as ValueError"""
+    try:
+        yield from ijson.items(events, "item")
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+
+def _iter_posts(f):
+    """
+    Get an iterator over the posts in an open batch file
+
+    Posts are streamed when ijson is available. Either way the top-level
+    JSON value is checked up front; with ijson, JSON that breaks further
+    into the file raises ValueError from the iterator itself.
+
+    Raises:
+        ValueError: If the file is not JSON or its top-level value is not an array
+    """
+    if ijson is not None:
+        events = ijson.parse(f)
+        try:
+            first = next(events, None)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+        if first is None or first[1] != "start_array":
+            raise ValueError("Batch file must contain a JSON array of posts")
+        return _stream_posts(chain([first], events))
+
+    posts = json.load(f)
+    if not isinstance(posts, list):
+        raise ValueError("Batch file must contain a JSON array of posts")
+    return iter(posts)
 
 
 def process_batch(input_file: str, config_file: str = None):
@@ -17,49 +65,70 @@ def process_batch(input_file: str, config_file: str = None):
         input_file: Path to JSON file with blog post data
         config_file: Optional path to config file
     """
-    # Load blog posts data
-    with open(input_file, 'r') as f:
-        posts = json.load(f)
+    # Imported here so argument parsing doesn't pay for loading Pillow
+    from image_generator import BlogImageGenerator, _init_worker, _render_post
 
-    # Initialize generator
-    generator = BlogImageGenerator(config_file)
+    # Each worker builds its own generator from this, so the parent only
+    # needs the config
+    config = BlogImageGenerator._load_config(config_file)
 
-    print(f"Processing {len(posts)} blog post images...\n")
+    logger.info(f"Processing blog post images from {input_file}...\n")
 
-    # Process each post
     successful = 0
     failed = 0
+    max_workers = os.cpu_count() or 1
 
-    for i, post in enumerate(posts, 1):
+    # Posts are read lazily and only a bounded window is in flight at once,
+    # so rendering starts on the first post and memory stays flat
+    with open(input_file, 'rb') as f:
         try:
-            title = post.get("title", "")
-            subtitle = post.get("subtitle", "")
-            template = post.get("template", "basic")
-            output = post.get("output", f"blog_post_{i}.png")
-
-            print(f"[{i}/{len(posts)}] Processing: {title[:50]}...")
-
-            # Generate image based on template type
-            if template == "gradient":
-                output_path = generator.create_gradient_template(title, subtitle, output)
-            elif template == "minimal":
-                output_path = generator.create_minimal_template(title, subtitle, output)
-            else:
-                output_path = generator.create_basic_template(title, subtitle, output)
-
-            print(f"  ✓ Created: {output_path}")
-            successful += 1
-
-        except Exception as e:
-            print(f"  ✗ Error: {str(e)}")
-            failed += 1
-
-    # Print summary
-    print(f"\n{'=' * 50}")
-    print(f"Batch processing complete!")
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-    print(f"{'=' * 50}")
+            posts = enumerate(_iter_posts(f), 1)
+        except ValueError as e:
+            logger.error(f"Error: {str(e)}")
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(config,)
+        ) as executor:
+            pending = {}
+
+            while True:
+                try:
+                    for i, post in islice(posts, max_workers * 2 - len(pending)):
+                        pending[executor.submit(_render_post, post, i)] = (i, post)
+                except ValueError as e:
+                    # The file broke partway through: finish what was
+                    # already submitted and stop reading
+                    logger.error(f"Error: {str(e)}")
+                    posts = iter(())
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, post = pending.pop(future)
+
+                    try:
+                        title = post.get("title", "")
+                        logger.info(f"[{i}] Processing: {title[:50]}...")
+
+                        output_path = future.result()
+                        logger.info(f"  ✓ Created: {output_path}")
+                        successful += 1
+
+                    except Exception as e:
+                        logger.error(f"  ✗ Error in post {i}: {str(e)}")
+                        failed += 1
+
+    # Log summary
+    logger.info(f"\n{'=' * 50}")
+    logger.info("Batch processing complete!")
+    logger.info(f"Successful: {successful}")
+    logger.info(f"Failed: {failed}")
+    logger.info(f"{'=' * 50}")
 
 
 def main():
@@ -79,13 +148,22 @@ def main():
 
     args = parser.parse_args()
 
-    # Check if input file exists
-    if not Path(args.input).exists():
-        print(f"Error: Input file '{args.input}' not found")
-        return
-
-    # Process batch
-    process_batch(args.input, args.config)
+    # Buffer progress output; it is written every 100 lines, on errors and at exit
+    handler = MemoryHandler(capacity=100, target=logging.StreamHandler(sys.stdout))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    try:
+        # Check if input file exists
+        if not Path(args.input).exists():
+            logger.error(f"Error: Input file '{args.input}' not found")
+            return
+
+        # Process batch
+        process_batch(args.input, args.config)
+    finally:
+        handler.close()
+        logger.removeHandler(handler)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,6 @@ CLI tool for blog post image generation
 """
 
 import argparse
-from image_generator import BlogImageGenerator
 
 
 def main():
@@ -56,6 +55,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help and usage errors stay fast
+    from image_generator import BlogImageGenerator
+
     # Initialize generator
     generator = BlogImageGenerator(args.config)
 
@@ -63,24 +65,12 @@ Examples:
     print(f"Generating {args.template} template image...")
 
     try:
-        if args.template == "gradient":
-            output_path = generator.create_gradient_template(
-                args.title,
-                args.subtitle,
-                args.output
-            )
-        elif args.template == "minimal":
-            output_path = generator.create_minimal_template(
-                args.title,
-                args.subtitle,
-                args.output
-            )
-        else:
-            output_path = generator.create_basic_template(
-                args.title,
-                args.subtitle,
-                args.output
-            )
+        output_path = generator.create_template(
+            args.template,
+            args.title,
+            args.subtitle,
+            args.output
+        )
 
         print(f"✓ Image created successfully: {output_path}")
 
@@ -6,9 +6,137 @@ Automates the creation of blog post images with burnt orange branding
 from PIL import Image, ImageDraw, ImageFont
 import os
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Tuple, Optional
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Number of renders remembered in the output directory's .cache.json
+RENDER_CACHE_SIZE = 256
+
+# Bump when template drawing changes so earlier renders are not reused
+_RENDER_CACHE_VERSION = 1
+
+FONT_OPTIONS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "C:\\Windows\\Fonts\\Arial.ttf"
+]
+
+
+def _find_font_path() -> Optional[str]:
+    """Return the first loadable font in FONT_OPTIONS, or None"""
+    for font_path in FONT_OPTIONS:
+        if os.path.exists(font_path):
+            try:
+                ImageFont.truetype(font_path)
+                return font_path
+            except OSError:
+                continue
+
+    return None
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
+    """Load a font once per (path, size) and share it across generators"""
+    if font_path is None:
+        # Fallback to default font
+        return ImageFont.load_default()
+
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=1024)
+def _text_length(font: ImageFont.FreeTypeFont, text: str) -> float:
+    """Horizontal advance of text in font, memoized per (font, text)"""
+    return font.getlength(text)
+
+
+def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
+    """Wrap text to fit within max_width"""
+    words = text.split()
+    lines = []
+    current_line = []
+    current_width = 0
+    space_width = _text_length(font, ' ')
+
+    # Advances are additive, so track the line width as a running sum of
+    # per-word widths instead of re-measuring the whole line every word
+    for word in words:
+        word_width = _text_length(font, word)
+        width = current_width + space_width + word_width if current_line else word_width
+
+        if width <= max_width:
+            current_line.append(word)
+            current_width = width
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = word_width
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+
+@lru_cache(maxsize=128)
+def _cached_layout(font_path: Optional[str], size: int, text: str, max_width: int) -> tuple:
+    """
+    Wrap and measure text, reused when the same text is rendered again
+
+    Args:
+        font_path: Font file path (None for the default font)
+        size: Font size
+        text: Text to wrap
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Tuple of (line, bbox) pairs
+    """
+    font = _load_font(font_path, size)
+    lines = _wrap_text(text, font, max_width)
+    return tuple((line, font.getbbox(line)) for line in lines)
+
+
+@lru_cache(maxsize=128)
+def _cached_text_mask(font_path: Optional[str], size: int, line: str) -> tuple:
+    """
+    Rasterize a line of text into an 'L' coverage mask
+
+    Args:
+        font_path: Font file path (None for the default font)
+        size: Font size
+        line: Text to rasterize
+
+    Returns:
+        Tuple of (mask, (left, top)) where (left, top) is the mask's offset
+        from the text origin
+    """
+    font = _load_font(font_path, size)
+    left, top, right, bottom = font.getbbox(line)
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), line, fill=255, font=font)
+    return mask, (left, top)
+
+
+def _file_digest(path: str) -> str:
+    """Content hash of a file, used to validate render cache entries"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
 
 class BlogImageGenerator:
     """Generate branded blog post images with burnt orange theme"""
@@ -21,20 +149,30 @@ class BlogImageGenerator:
     DARK_GRAY = "#2C2C2C"
     WHITE = "#FFFFFF"
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Font used for all text, probed once when the module is loaded
+    _FONT_PATH = _find_font_path()
+
+    def __init__(self, config_path: Optional[str] = None, config: Optional[dict] = None):
         """
         Initialize the image generator
 
         Args:
             config_path: Path to configuration file (optional)
+            config: Configuration values applied over the file/defaults (optional)
         """
         self.config = self._load_config(config_path)
+        if config:
+            self.config.update(config)
         self.width = self.config.get("width", 1200)
         self.height = self.config.get("height", 630)
         self.output_dir = Path(self.config.get("output_dir", "output"))
         self.output_dir.mkdir(exist_ok=True)
 
-    def _load_config(self, config_path: Optional[str]) -> dict:
+        # Title-independent template backgrounds, see _base()
+        self._bases = {}
+
+    @classmethod
+    def _load_config(cls, config_path: Optional[str]) -> dict:
         """Load configuration from file or use defaults"""
         default_config = {
             "width": 1200,
@@ -42,9 +180,11 @@ class BlogImageGenerator:
             "output_dir": "output",
             "font_title_size": 72,
             "font_subtitle_size": 36,
-            "primary_color": self.BURNT_ORANGE,
-            "background_color": self.CREAM,
-            "text_color": self.DARK_GRAY
+            "primary_color": cls.BURNT_ORANGE,
+            "background_color": cls.CREAM,
+            "text_color": cls.DARK_GRAY,
+            "png_compress_level": 1,
+            "render_cache": True
         }
 
         if config_path and os.path.exists(config_path):
@@ -56,63 +196,162 @@ class BlogImageGenerator:
 
     def _get_font(self, size: int) -> ImageFont.FreeTypeFont:
         """Get font with fallback options"""
-        font_options = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "C:\\Windows\\Fonts\\Arial.ttf"
-        ]
-
-        for font_path in font_options:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size)
-                except:
-                    continue
-
-        # Fallback to default font
-        return ImageFont.load_default()
-
-    def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
-        """Wrap text to fit within max_width"""
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
-
-            if width <= max_width:
-                current_line.append(word)
+        return _load_font(self._FONT_PATH, size)
+
+    @staticmethod
+    def _blend_white(value: int, alpha: int) -> int:
+        """Blend a channel value toward white, rounding like Image.paste"""
+        tmp = value * (255 - alpha) + 255 * alpha + 128
+        return ((tmp >> 8) + tmp) >> 8
+
+    def _layout(self, text: str, size: int, max_width: int) -> tuple:
+        """Wrap text to max_width and return (line, bbox) for each line"""
+        return _cached_layout(self._FONT_PATH, size, text, max_width)
+
+    def _text_mask(self, line: str, size: int) -> tuple:
+        """Rasterize line once into an 'L' mask and return (mask, (left, top))"""
+        return _cached_text_mask(self._FONT_PATH, size, line)
+
+    def _render_key(self, template: str, title: str, subtitle: str, output_filename: str) -> Optional[str]:
+        """Hash everything that determines a rendered image (None if caching is off)"""
+        if not self.config.get("render_cache"):
+            return None
+
+        payload = json.dumps(
+            [_RENDER_CACHE_VERSION, self._FONT_PATH, template, title, subtitle,
+             output_filename, self.width, self.height, self.config],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _read_render_cache(self) -> dict:
+        """Load the render cache sidecar, treating a missing or bad file as empty"""
+        try:
+            with open(self.output_dir / ".cache.json", 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _render_cache_lock(self):
+        """Hold an exclusive lock on the render cache across processes"""
+        with open(self.output_dir / ".cache.lock", 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _remember_render(self, key: str, output_path: str, digest: Optional[str] = None) -> None:
+        """Record output_path under key, keeping the most recently used entries"""
+        entry = {
+            "path": output_path,
+            "size": os.stat(output_path).st_size,
+            "digest": digest or _file_digest(output_path)
+        }
 
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Pool workers update the cache concurrently, so the read-modify-write
+        # must be serialized or their entries overwrite each other
+        with self._render_cache_lock():
+            self._write_render_entry(key, entry)
+
+    def _write_render_entry(self, key: str, entry: dict) -> None:
+        """Merge one entry into the render cache sidecar (caller holds the lock)"""
+        cache = self._read_render_cache()
+
+        # A file holds only one render, so any other entry for this path is stale
+        cache = {k: v for k, v in cache.items() if k != key and v.get("path") != entry["path"]}
+        cache[key] = entry
+        while len(cache) > RENDER_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+        # Write to a temp file and swap it in so lock-free readers never
+        # see a half-written cache
+        cache_path = self.output_dir / ".cache.json"
+        tmp_path = cache_path.with_name(f".cache.json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+
+    def _cached_render(self, key: Optional[str]) -> Optional[str]:
+        """Return the path of an identical earlier render still on disk, if any"""
+        if key is None:
+            return None
+
+        entry = self._read_render_cache().get(key)
+        if entry is None:
+            return None
+
+        # The file must still hold exactly the bytes we wrote: compare the
+        # size first as a cheap filter, then the content digest
+        try:
+            if os.stat(entry["path"]).st_size != entry.get("size"):
+                return None
+            if _file_digest(entry["path"]) != entry.get("digest"):
+                return None
+        except OSError:
+            return None
+
+        self._remember_render(key, entry["path"], entry["digest"])
+        return entry["path"]
+
+    def _save(self, img: Image.Image, output_filename: str, cache_key: Optional[str] = None) -> str:
+        """Save image to the output directory and return its path"""
+        output_path = self.output_dir / output_filename
 
-        return lines
+        # A configured output_format (e.g. "webp") overrides the filename suffix
+        output_format = self.config.get("output_format")
+        if output_format:
+            output_format = output_format.lower().lstrip(".")
+            if output_format not in ("png", "jpg", "jpeg", "webp"):
+                raise ValueError(f"Unsupported output_format: {self.config['output_format']!r}")
+            output_path = output_path.with_suffix(f".{output_format}")
+
+        # Favor encode speed: low zlib level for PNG (configurable),
+        # single-pass JPEG, fastest WebP method
+        suffix = output_path.suffix.lower()
+        if suffix == ".webp":
+            img.save(output_path, format="WEBP", quality=85, method=0)
+        elif suffix in (".jpg", ".jpeg"):
+            img.save(output_path, quality=85, optimize=False)
+        else:
+            img.save(
+                output_path,
+                compress_level=self.config["png_compress_level"],
+                optimize=False
+            )
+
+        if cache_key is not None:
+            self._remember_render(cache_key, str(output_path))
 
-    def create_basic_template(
-        self,
-        title: str,
-        subtitle: str = "",
-        output_filename: str = "blog_image.png"
-    ) -> str:
-        """
-        Create a basic blog post image with burnt orange theme
+        return str(output_path)
 
-        Args:
-            title: Main title text
-            subtitle: Optional subtitle text
-            output_filename: Output filename
+    def _base(self, template: str) -> Image.Image:
+        """
+        Title-independent background of a template, built once and reused
 
-        Returns:
-            Path to generated image
+        The cached image is rebuilt whenever the size or colors it was drawn
+        with have changed since.
         """
+        key = (self.width, self.height, self.config["background_color"], self.config["primary_color"])
+        cached = self._bases.get(template)
+        if cached is None or cached[0] != key:
+            build = getattr(self, f"_build_{template}_base")
+            cached = self._bases[template] = (key, build())
+        return cached[1]
+
+    def _build_basic_base(self) -> Image.Image:
+        """Title-independent background and bars of the basic template"""
         # Create image with cream background
         img = Image.new('RGB', (self.width, self.height), self.config["background_color"])
         draw = ImageDraw.Draw(img)
@@ -138,42 +377,107 @@ class BlogImageGenerator:
             fill=self.LIGHT_ORANGE
         )
 
+        return img
+
+    def _build_minimal_base(self) -> Image.Image:
+        """Title-independent background and accent lines of the minimal template"""
+        # Create image with white background
+        img = Image.new('RGB', (self.width, self.height), self.WHITE)
+        draw = ImageDraw.Draw(img)
+
+        # Add burnt orange accent line
+        line_thickness = 8
+        margin = 50
+        draw.rectangle(
+            [(margin, margin), (self.width - margin, margin + line_thickness)],
+            fill=self.BURNT_ORANGE
+        )
+
+        # Add bottom accent line
+        draw.rectangle(
+            [(margin, self.height - margin - line_thickness), (self.width - margin, self.height - margin)],
+            fill=self.LIGHT_ORANGE
+        )
+
+        return img
+
+    def _build_gradient_base(self) -> Image.Image:
+        """Title-independent background of the gradient template"""
+        # Create gradient background from burnt orange to cream: compute one
+        # pixel column of row colors, lightened by a semi-transparent white
+        # overlay (alpha 180) for text readability, then stretch it across
+        # the full width
+        column = bytearray()
+        for y in range(self.height):
+            ratio = y / self.height
+            r = int(204 * (1 - ratio) + 255 * ratio)
+            g = int(85 * (1 - ratio) + 248 * ratio)
+            b = int(0 * (1 - ratio) + 220 * ratio)
+            column += bytes(self._blend_white(c, 180) for c in (r, g, b))
+        img = Image.frombytes('RGB', (1, self.height), bytes(column))
+        return img.resize((self.width, self.height), Image.NEAREST)
+
+    def create_basic_template(
+        self,
+        title: str,
+        subtitle: str = "",
+        output_filename: str = "blog_image.png"
+    ) -> str:
+        """
+        Create a basic blog post image with burnt orange theme
+
+        Args:
+            title: Main title text
+            subtitle: Optional subtitle text
+            output_filename: Output filename
+
+        Returns:
+            Path to generated image
+        """
+        # Reuse an identical earlier render if it is still on disk
+        cache_key = self._render_key("basic", title, subtitle, output_filename)
+        cached_path = self._cached_render(cache_key)
+        if cached_path:
+            return cached_path
+
+        # Start from the pre-drawn cream background, header/footer bars and accent
+        img = self._base("basic").copy()
+        draw = ImageDraw.Draw(img)
+
+        header_height = self.height // 6
+        accent_width = self.width // 20
+
         # Prepare fonts
-        title_font = self._get_font(self.config["font_title_size"])
         subtitle_font = self._get_font(self.config["font_subtitle_size"])
 
         # Wrap and draw title
         max_text_width = self.width - (accent_width + 100)
-        title_lines = self._wrap_text(title, title_font, max_text_width)
+        title_lines = self._layout(title, self.config["font_title_size"], max_text_width)
 
         y_offset = header_height + 100
-        for line in title_lines:
-            bbox = draw.textbbox((0, 0), line, font=title_font)
+        for line, bbox in title_lines:
             text_width = bbox[2] - bbox[0]
             x = accent_width + (self.width - accent_width - text_width) // 2
 
-            # Draw text with shadow for depth
-            draw.text((x + 2, y_offset + 2), line, fill=self.DARK_ORANGE, font=title_font)
-            draw.text((x, y_offset), line, fill=self.config["text_color"], font=title_font)
+            # Draw text with shadow for depth, blitting one rasterized mask twice
+            mask, (left, top) = self._text_mask(line, self.config["font_title_size"])
+            draw.bitmap((x + left + 2, y_offset + top + 2), mask, fill=self.DARK_ORANGE)
+            draw.bitmap((x + left, y_offset + top), mask, fill=self.config["text_color"])
             y_offset += bbox[3] - bbox[1] + 20
 
         # Draw subtitle if provided
         if subtitle:
             y_offset += 30
-            subtitle_lines = self._wrap_text(subtitle, subtitle_font, max_text_width)
+            subtitle_lines = self._layout(subtitle, self.config["font_subtitle_size"], max_text_width)
 
-            for line in subtitle_lines:
-                bbox = draw.textbbox((0, 0), line, font=subtitle_font)
+            for line, bbox in subtitle_lines:
                 text_width = bbox[2] - bbox[0]
                 x = accent_width + (self.width - accent_width - text_width) // 2
                 draw.text((x, y_offset), line, fill=self.DARK_GRAY, font=subtitle_font)
                 y_offset += bbox[3] - bbox[1] + 15
 
         # Save image
-        output_path = self.output_dir / output_filename
-        img.save(output_path, quality=95, optimize=True)
-
-        return str(output_path)
+        return self._save(img, output_filename, cache_key)
 
     def create_gradient_template(
         self,
@@ -192,63 +496,50 @@ class BlogImageGenerator:
         Returns:
             Path to generated image
         """
-        # Create image
-        img = Image.new('RGB', (self.width, self.height), self.WHITE)
-        draw = ImageDraw.Draw(img)
-
-        # Create gradient background from burnt orange to cream
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(204 * (1 - ratio) + 255 * ratio)
-            g = int(85 * (1 - ratio) + 248 * ratio)
-            b = int(0 * (1 - ratio) + 220 * ratio)
-            draw.line([(0, y), (self.width, y)], fill=(r, g, b))
-
-        # Add semi-transparent overlay for better text readability
-        overlay = Image.new('RGBA', (self.width, self.height), (255, 255, 255, 180))
-        img.paste(overlay, (0, 0), overlay)
-        img = img.convert('RGB')
+        # Reuse an identical earlier render if it is still on disk
+        cache_key = self._render_key("gradient", title, subtitle, output_filename)
+        cached_path = self._cached_render(cache_key)
+        if cached_path:
+            return cached_path
+
+        # Start from the pre-computed gradient background
+        img = self._base("gradient").copy()
         draw = ImageDraw.Draw(img)
 
         # Prepare fonts
-        title_font = self._get_font(self.config["font_title_size"])
         subtitle_font = self._get_font(self.config["font_subtitle_size"])
 
         # Draw title
         max_text_width = self.width - 100
-        title_lines = self._wrap_text(title, title_font, max_text_width)
+        title_lines = self._layout(title, self.config["font_title_size"], max_text_width)
 
-        total_text_height = sum([title_font.getbbox(line)[3] for line in title_lines])
+        total_text_height = sum([bbox[3] for line, bbox in title_lines])
         y_offset = (self.height - total_text_height) // 2 - 50
 
-        for line in title_lines:
-            bbox = draw.textbbox((0, 0), line, font=title_font)
+        for line, bbox in title_lines:
             text_width = bbox[2] - bbox[0]
             x = (self.width - text_width) // 2
 
-            # Draw with outline for better visibility
+            # Draw with outline for better visibility, rasterizing the line once
+            mask, (left, top) = self._text_mask(line, self.config["font_title_size"])
             for adj in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-                draw.text((x + adj[0], y_offset + adj[1]), line, fill=self.WHITE, font=title_font)
-            draw.text((x, y_offset), line, fill=self.BURNT_ORANGE, font=title_font)
+                draw.bitmap((x + left + adj[0], y_offset + top + adj[1]), mask, fill=self.WHITE)
+            draw.bitmap((x + left, y_offset + top), mask, fill=self.BURNT_ORANGE)
             y_offset += bbox[3] - bbox[1] + 20
 
         # Draw subtitle if provided
         if subtitle:
             y_offset += 30
-            subtitle_lines = self._wrap_text(subtitle, subtitle_font, max_text_width)
+            subtitle_lines = self._layout(subtitle, self.config["font_subtitle_size"], max_text_width)
 
-            for line in subtitle_lines:
-                bbox = draw.textbbox((0, 0), line, font=subtitle_font)
+            for line, bbox in subtitle_lines:
                 text_width = bbox[2] - bbox[0]
                 x = (self.width - text_width) // 2
                 draw.text((x, y_offset), line, fill=self.DARK_ORANGE, font=subtitle_font)
                 y_offset += bbox[3] - bbox[1] + 15
 
         # Save image
-        output_path = self.output_dir / output_filename
-        img.save(output_path, quality=95, optimize=True)
-
-        return str(output_path)
+        return self._save(img, output_filename, cache_key)
 
     def create_minimal_template(
         self,
@@ -267,17 +558,17 @@ class BlogImageGenerator:
         Returns:
             Path to generated image
         """
-        # Create image with white background
-        img = Image.new('RGB', (self.width, self.height), self.WHITE)
+        # Reuse an identical earlier render if it is still on disk
+        cache_key = self._render_key("minimal", title, subtitle, output_filename)
+        cached_path = self._cached_render(cache_key)
+        if cached_path:
+            return cached_path
+
+        # Start from the pre-drawn white background and accent lines
+        img = self._base("minimal").copy()
         draw = ImageDraw.Draw(img)
 
-        # Add burnt orange accent line
-        line_thickness = 8
         margin = 50
-        draw.rectangle(
-            [(margin, margin), (self.width - margin, margin + line_thickness)],
-            fill=self.BURNT_ORANGE
-        )
 
         # Prepare fonts
         title_font = self._get_font(self.config["font_title_size"])
@@ -285,11 +576,10 @@ class BlogImageGenerator:
 
         # Draw title
         max_text_width = self.width - (margin * 2)
-        title_lines = self._wrap_text(title, title_font, max_text_width)
+        title_lines = self._layout(title, self.config["font_title_size"], max_text_width)
 
         y_offset = margin + 80
-        for line in title_lines:
-            bbox = draw.textbbox((0, 0), line, font=title_font)
+        for line, bbox in title_lines:
             text_width = bbox[2] - bbox[0]
             x = margin
             draw.text((x, y_offset), line, fill=self.DARK_GRAY, font=title_font)
@@ -298,56 +588,123 @@ class BlogImageGenerator:
         # Draw subtitle if provided
         if subtitle:
             y_offset += 30
-            subtitle_lines = self._wrap_text(subtitle, subtitle_font, max_text_width)
+            subtitle_lines = self._layout(subtitle, self.config["font_subtitle_size"], max_text_width)
 
-            for line in subtitle_lines:
+            for line, bbox in subtitle_lines:
                 draw.text((margin, y_offset), line, fill=self.BURNT_ORANGE, font=subtitle_font)
-                bbox = draw.textbbox((0, 0), line, font=subtitle_font)
                 y_offset += bbox[3] - bbox[1] + 15
 
-        # Add bottom accent line
-        draw.rectangle(
-            [(margin, self.height - margin - line_thickness), (self.width - margin, self.height - margin)],
-            fill=self.LIGHT_ORANGE
-        )
-
         # Save image
-        output_path = self.output_dir / output_filename
-        img.save(output_path, quality=95, optimize=True)
+        return self._save(img, output_filename, cache_key)
 
-        return str(output_path)
+    def create_template(
+        self,
+        template: str,
+        title: str,
+        subtitle: str = "",
+        output_filename: str = "blog_image.png"
+    ) -> str:
+        """
+        Create a blog post image with the named template
+
+        Args:
+            template: Template name ("basic", "gradient" or "minimal")
+            title: Main title text
+            subtitle: Optional subtitle text
+            output_filename: Output filename
+
+        Returns:
+            Path to generated image
+        """
+        if template == "gradient":
+            return self.create_gradient_template(title, subtitle, output_filename)
+        elif template == "minimal":
+            return self.create_minimal_template(title, subtitle, output_filename)
+        else:
+            return self.create_basic_template(title, subtitle, output_filename)
+
+    def _worker_config(self) -> dict:
+        """Config for worker processes, including any changes made on this instance"""
+        return {
+            **self.config,
+            "width": self.width,
+            "height": self.height,
+            "output_dir": str(self.output_dir)
+        }
+
+    def generate_batch(self, posts: list, max_workers: Optional[int] = None) -> list:
+        """
+        Create images for several posts in parallel worker processes
+
+        Args:
+            posts: Post dicts with "title" and optional "subtitle", "template"
+                and "output" keys (same format as batch JSON files)
+            max_workers: Number of worker processes (default: one per CPU,
+                at most one per post)
+
+        Returns:
+            Paths to generated images, in the same order as posts
+        """
+        if max_workers is None:
+            max_workers = max(1, min(os.cpu_count() or 1, len(posts)))
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self._worker_config(),)
+        ) as executor:
+            return list(executor.map(_render_post, posts, range(1, len(posts) + 1)))
+
+
+# Per-process generator used by pool workers (generate_batch, batch_generator)
+_worker_generator = None
+
+
+def _init_worker(config: dict):
+    """Create the generator used by this worker process"""
+    global _worker_generator
+    _worker_generator = BlogImageGenerator(config=config)
+
+
+def _render_post(post: dict, index: int) -> str:
+    """Render one post dict with this worker's generator"""
+    return _worker_generator.create_template(
+        post.get("template", "basic"),
+        post.get("title", ""),
+        post.get("subtitle", ""),
+        post.get("output", f"blog_post_{index}.png")
+    )
 
 
 def main():
     """Example usage"""
     generator = BlogImageGenerator()
 
-    # Example 1: Basic template
-    print("Creating basic template...")
-    output1 = generator.create_basic_template(
-        title="Automate Your Blog Post Images",
-        subtitle="Save time with automated image generation",
-        output_filename="example_basic.png"
-    )
-    print(f"Created: {output1}")
-
-    # Example 2: Gradient template
-    print("Creating gradient template...")
-    output2 = generator.create_gradient_template(
-        title="Beautiful Blog Post Images",
-        subtitle="Professional designs in seconds",
-        output_filename="example_gradient.png"
-    )
-    print(f"Created: {output2}")
-
-    # Example 3: Minimal template
-    print("Creating minimal template...")
-    output3 = generator.create_minimal_template(
-        title="Clean and Simple Design",
-        subtitle="Minimal yet effective",
-        output_filename="example_minimal.png"
-    )
-    print(f"Created: {output3}")
+    # The three examples are independent, so render them in parallel
+    print("Creating basic, gradient and minimal templates...")
+    outputs = generator.generate_batch([
+        {
+            "template": "basic",
+            "title": "Automate Your Blog Post Images",
+            "subtitle": "Save time with automated image generation",
+            "output": "example_basic.png"
+        },
+        {
+            "template": "gradient",
+            "title": "Beautiful Blog Post Images",
+            "subtitle": "Professional designs in seconds",
+            "output": "example_gradient.png"
+        },
+        {
+            "template": "minimal",
+            "title": "Clean and Simple Design",
+            "subtitle": "Minimal yet effective",
+            "output": "example_minimal.png"
+        }
+    ], max_workers=3)
+
+    for output in outputs:
+        print(f"Created: {output}")
 
 
 if __name__ == "__main__":